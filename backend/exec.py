@@ -2,7 +2,7 @@ import os
 import subprocess
 import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 
 @dataclass
@@ -66,7 +66,69 @@ def _docker_exec(command: List[str], timeout_s: Optional[int] = None) -> ExecRes
     )
 
 
+def _docker_exec_stream(command: List[str], timeout_s: Optional[int] = None) -> Iterator[str]:
+    container = "attacker"
+    # Popen is called eagerly so a missing docker binary fails before the response starts
+    proc = subprocess.Popen(
+        ["docker", "exec", container] + command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    return _iter_output(proc, timeout_s)
+
+
+def _iter_output(proc: subprocess.Popen, timeout_s: Optional[int]) -> Iterator[str]:
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = None
+    if timeout_s is not None:
+        timer = threading.Timer(timeout_s, _kill)
+        timer.daemon = True
+        timer.start()
+
+    try:
+        if proc.stdout is not None:
+            for line in proc.stdout:
+                yield line
+        proc.wait()
+        if timed_out.is_set():
+            yield "[timeout]\n"
+        elif proc.returncode != 0:
+            # the status line is already sent, so report failure in-band
+            yield f"[exit code {proc.returncode}]\n"
+    finally:
+        if timer is not None:
+            timer.cancel()
+        # client disconnected mid-stream
+        if proc.poll() is None:
+            proc.kill()
+        if proc.stdout is not None:
+            try:
+                proc.stdout.close()
+            except Exception:
+                pass
+        proc.wait()
+
+
+def _recon_nmap_command() -> List[str]:
+    return ["nmap", "-sV", "--version-light", "-Pn", "--open", "-T4", "victim"]
+
+
+def _recon_nmap_timeout() -> int:
+    return int(os.getenv("RECON_NMAP_TIMEOUT_S", "300"))
+
+
 def run_recon_nmap() -> ExecResult:
-    timeout_s = int(os.getenv("RECON_NMAP_TIMEOUT_S", "300"))
-    nmap_cmd = ["nmap", "-sV", "--version-light", "-Pn", "--open", "-T4", "victim"]
-    return _docker_exec(nmap_cmd, timeout_s=timeout_s)
+    return _docker_exec(_recon_nmap_command(), timeout_s=_recon_nmap_timeout())
+
+
+def stream_recon_nmap() -> Iterator[str]:
+    return _docker_exec_stream(_recon_nmap_command(), timeout_s=_recon_nmap_timeout())
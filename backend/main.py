@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 
-from backend.exec import run_recon_nmap
+from backend.exec import run_recon_nmap, stream_recon_nmap
 
 app = FastAPI(title="Decepticon Execution API")
 
@@ -24,6 +25,18 @@ def execute_recon():
     }
 
 
+@app.post("/execute/recon/stream")
+def execute_recon_stream():
+    try:
+        lines = stream_recon_nmap()
+    except FileNotFoundError:
+        raise HTTPException(status_code=500, detail="Docker is not installed or not in PATH")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(lines, media_type="text/plain; charset=utf-8")
+
+
 @app.post("/run-recon")
 def run_recon_compat():
     return execute_recon()
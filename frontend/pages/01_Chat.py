@@ -4,12 +4,16 @@ Main Chat Page (리팩토링됨)
 """
 
 import streamlit as st
-import asyncio
 import threading
 import os
+import re
 import sys
 import time
-import requests
+import hashlib
+import httpx
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import AsyncIterator, Final, Optional
 
 try:
     from streamlit.runtime.scriptrunner_utils.exceptions import StopException
@@ -39,27 +43,45 @@ from frontend.web.core.app_state import get_app_state_manager
 from frontend.web.core.executor_manager import get_executor_manager
 from frontend.web.core.workflow_handler import get_workflow_handler
 from frontend.web.core.terminal_processor import get_terminal_processor
+from frontend.web.core.async_runner import get_async_runner
 
 # 검증 로직
 from frontend.web.utils.validation import check_model_required
 from frontend.web.utils.constants import ICON, ICON_TEXT, COMPANY_LINK
 
-# 재현 관리
-from frontend.web.core.chat_replay import ReplayManager
+# Recon 리포트 프롬프트 (Nmap 원문 앞에 붙는 고정 접두부)
+_RECON_PROMPT_PREFIX: Final[str] = (
+    "You are a security analyst. Analyze the following raw Nmap output and produce a Reconnaissance Report with:\n"
+    "1) Open ports list\n"
+    "2) Services and versions\n"
+    "3) High-level risk assessment\n"
+    "4) Reconnaissance summary\n"
+    "5) Recommendation for next phase (Initial Access - simulated)\n\n"
+    "RAW OUTPUT:\n"
+)
 
-from src.utils.llm.config_manager import get_current_llm
 
-# 전역 매니저들 초기화
+# 전역 매니저들 (getter가 프로세스 단위 싱글톤 반환)
 app_state = get_app_state_manager()
-executor_manager = get_executor_manager()  
+executor_manager = get_executor_manager()
 workflow_handler = get_workflow_handler()
 terminal_processor = get_terminal_processor()
 
-# UI 컴포넌트들 초기화
-theme_ui = ThemeUIComponent()
+
+@st.cache_resource(show_spinner=False)
+def _ui_components() -> SimpleNamespace:
+    """상태 없는 UI 컴포넌트 - 생성 시 프로젝트 루트 탐색이 있어 리런마다 재생성하지 않도록 캐시"""
+    theme = ThemeUIComponent()
+    return SimpleNamespace(theme_ui=theme, sidebar=SidebarComponent(theme_ui=theme))
+
+
+_UI = _ui_components()
+theme_ui = _UI.theme_ui
+sidebar = _UI.sidebar
+
+# 리런 단위 UI 컴포넌트 (CSS 주입, 터미널 placeholder 등 리런별 상태 보유)
 chat_messages = ChatMessagesComponent()
 terminal_ui = TerminalUIComponent()
-sidebar = SidebarComponent()
 
 
 def main():
@@ -67,9 +89,7 @@ def main():
     
     # 앱 상태 초기화 먼저 수행 (전체 관리자 초기화 포함)
     try:
-        app_state._initialize_session_state()
-        app_state._initialize_user_session()
-        app_state._initialize_logging()
+        _ensure_app_state_initialized()
     except Exception as e:
         st.error(f"앱 상태 초기화 오류: {str(e)}")
         return
@@ -111,6 +131,7 @@ def main():
     _render_recon_report_section()
     
     # 재현 모드 처리
+    from frontend.web.core.chat_replay import ReplayManager
     replay_manager = ReplayManager()
     if replay_manager.is_replay_mode():
         _handle_replay_mode(replay_manager)
@@ -120,57 +141,205 @@ def main():
     _display_main_interface()
 
 
+def _ensure_app_state_initialized():
+    """세션당 한 번만 앱 상태 초기화 - 이후 리런에서는 플래그 확인만 수행
+
+    app_state는 프로세스 단위로 캐시되므로 세션별 키 초기화는 여기서 세션마다 실행한다.
+    """
+    if st.session_state.get("app_state_initialized", False):
+        return
+    app_state._initialize_session_state()
+    app_state._initialize_user_session()
+    app_state._initialize_logging()
+    st.session_state.app_state_initialized = True
+
+
+def _run_async_safely(coro):
+    """세션 영속 이벤트 루프에서 코루틴 실행 - Streamlit StopException은 무시"""
+    try:
+        return get_async_runner().run(coro)
+    except BaseException as e:
+        if StopException is not None and isinstance(e, StopException):
+            return None
+        raise
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Exec API 호출용 비동기 클라이언트 - 세션 이벤트 루프에서 커넥션 풀 재사용
+
+    루프 실행기에 등록되어 세션 종료로 루프가 정리될 때 함께 aclose()된다.
+    """
+    if "exec_api_client" not in st.session_state:
+        st.session_state.exec_api_client = get_async_runner().register(httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+            timeout=httpx.Timeout(330.0, connect=5.0),
+            # 응답이 작은 텍스트이므로 압축 해제 비용 생략
+            headers={"Accept-Encoding": "identity"},
+        ))
+    return st.session_state.exec_api_client
+
+
+async def _iter_recon_output(url: str, timeout: httpx.Timeout) -> AsyncIterator[str]:
+    """Exec API 스트리밍 응답을 도착하는 대로 텍스트 청크 단위로 전달"""
+    async with _get_http_client().stream("POST", url, timeout=timeout) as resp:
+        if resp.status_code != 200:
+            await resp.aread()
+            raise httpx.HTTPStatusError(
+                f"Recon API error ({resp.status_code})", request=resp.request, response=resp
+            )
+        async for chunk in resp.aiter_text():
+            yield chunk
+
+
+# 스트리밍 응답 끝의 nmap 비정상 종료 표시 줄 (백엔드 _iter_output 참고)
+_RECON_EXIT_CODE_RE: Final = re.compile(r"\[exit code (-?\d+)\]\s*$")
+# 실시간 출력 갱신 최소 간격 (초)
+_RECON_LIVE_UPDATE_INTERVAL_S: Final[float] = 0.5
+
+
 def _run_recon_nmap():
     api_base = os.getenv("EXEC_API_BASE_URL", "http://127.0.0.1:8000")
-    url = f"{api_base.rstrip('/')}/execute/recon"
+    url = f"{api_base.rstrip('/')}/execute/recon/stream"
 
     terminal_ui.add_command("nmap -sV --version-light -Pn --open -T4 victim")
 
     try:
+        # 백엔드 nmap 타임아웃보다 약간 길게, 연결 실패는 빠르게
+        recon_timeout = int(os.getenv("RECON_NMAP_TIMEOUT_S", "300")) + 30
+        timeout = httpx.Timeout(recon_timeout, connect=5.0)
+
+        # 전체 결과를 기다리지 않고 도착한 출력부터 바로 표시
+        chunks = []
+        live_output = st.empty()
+        last_update = 0.0
         with st.spinner("Running nmap in Kali container..."):
-            resp = requests.post(url, timeout=330)
-        if resp.status_code != 200:
-            terminal_ui.add_output(resp.text)
-            st.error(f"Recon API error ({resp.status_code})")
-            return
-
-        payload = resp.json()
-        output = payload.get("output") or ""
+            for chunk in get_async_runner().iterate(_iter_recon_output(url, timeout)):
+                chunks.append(chunk)
+                # 버퍼 전체 재전송은 일정 간격으로만 (청크마다 하면 출력 길이의 제곱에 비례)
+                now = time.monotonic()
+                if now - last_update >= _RECON_LIVE_UPDATE_INTERVAL_S:
+                    live_output.code("".join(chunks), language=None)
+                    last_update = now
+        live_output.empty()
+
+        output = "".join(chunks)
         terminal_ui.add_output(output)
 
+        # 응답 상태 코드가 이미 전송된 뒤 종료되므로 실패는 출력 끝 종료 코드 줄로 전달됨
+        exit_match = _RECON_EXIT_CODE_RE.search(output)
+        if exit_match:
+            if not output[:exit_match.start()].strip():
+                st.error(f"nmap failed with no output (exit code {exit_match.group(1)})")
+                return
+            st.warning(f"nmap exited with code {exit_match.group(1)}")
+
         st.session_state["recon_output"] = output
-        st.session_state["recon_report"] = _generate_recon_report(output)
+        # 리포트는 _render_recon_report_section에서 스트리밍 생성
+        st.session_state.pop("recon_report", None)
 
+    except httpx.HTTPStatusError as e:
+        terminal_ui.add_output(e.response.text)
+        st.error(f"Recon API error ({e.response.status_code})")
     except Exception as e:
         terminal_ui.add_output(str(e))
         st.error(f"Failed to call recon API: {e}")
 
 
-def _generate_recon_report(raw_output: str) -> str:
-    llm = get_current_llm()
-    if llm is None:
-        return "LLM is not available. Please select a model and ensure API keys are configured."
-
-    prompt = (
-        "You are a security analyst. Analyze the following raw Nmap output and produce a Reconnaissance Report with:\n"
-        "1) Open ports list\n"
-        "2) Services and versions\n"
-        "3) High-level risk assessment\n"
-        "4) Reconnaissance summary\n"
-        "5) Recommendation for next phase (Initial Access - simulated)\n\n"
-        "RAW OUTPUT:\n" + raw_output
-    )
+def _stream_recon_report(raw_output: str) -> str:
+    """Recon 리포트 표시 - 캐시 적중 시 바로 표시, 아니면 LLM 토큰 스트리밍 후 캐시 저장"""
+    from src.utils.llm.config_manager import get_current_llm, get_current_llm_config
+
+    if get_current_llm() is None:
+        report = "LLM is not available. Please select a model and ensure API keys are configured."
+        st.markdown(report)
+        return report
+
+    raw_output_hash = _recon_output_digest(raw_output)
+    model_name = get_current_llm_config().model_name
+    cache_key = (raw_output_hash, model_name)
+    report = _get_cached_recon_report(cache_key)
+    if report is not None:
+        st.markdown(report)
+        return report
 
     try:
-        resp = llm.invoke(prompt)
-        return getattr(resp, "content", str(resp))
+        report = st.write_stream(get_async_runner().iterate(_generate_recon_report(raw_output)))
     except Exception as e:
-        return (
+        report = (
             "AI analysis is temporarily unavailable.\n\n"
             f"Error: {e}\n\n"
             "You can still use the REAL terminal output above for screenshots. "
             "Retry after fixing model connectivity."
         )
+        st.markdown(report)
+        return report
+
+    if isinstance(report, str) and report:
+        _set_cached_recon_report(cache_key, report)
+    return report
+
+
+# 스캔마다 달라지는 Nmap 출력 부분 (시작 시각, 소요 시간, 응답 지연)
+_NMAP_VOLATILE_RE: Final = re.compile(
+    r"^(?:Starting Nmap .*|Nmap done: .*)$|\(\d+(?:\.\d+)?s latency\)",
+    re.MULTILINE,
+)
+
+
+def _recon_output_digest(raw_output: str) -> str:
+    """리포트 캐시 키용 Nmap 출력 다이제스트 - 실행별 가변 부분 제외, 같은 스캔 결과면 같은 키"""
+    stable_output = _NMAP_VOLATILE_RE.sub("", raw_output)
+    return hashlib.blake2b(stable_output.encode(), digest_size=16).hexdigest()
+
+
+# Recon 리포트 캐시 유효 시간(초) 및 최대 항목 수
+_RECON_REPORT_TTL_S: Final[float] = 3600.0
+_RECON_REPORT_MAX_ENTRIES: Final[int] = 64
+
+
+@st.cache_resource(show_spinner=False)
+def _recon_report_cache() -> SimpleNamespace:
+    """(raw_output_hash, model_name) -> (저장 시각, 리포트) 프로세스 전역 캐시 - 세션 스레드 간 공유"""
+    return SimpleNamespace(lock=threading.Lock(), entries=OrderedDict())
+
+
+def _get_cached_recon_report(key: tuple) -> Optional[str]:
+    """캐시된 리포트 반환 - 없거나 만료되었으면 None"""
+    cache = _recon_report_cache()
+    with cache.lock:
+        entry = cache.entries.get(key)
+        if entry is None:
+            return None
+        stored_at, report = entry
+        if time.monotonic() - stored_at > _RECON_REPORT_TTL_S:
+            del cache.entries[key]
+            return None
+        return report
+
+
+def _set_cached_recon_report(key: tuple, report: str):
+    """리포트 저장 - 최대 항목 수 초과 시 가장 오래된 항목부터 제거"""
+    cache = _recon_report_cache()
+    with cache.lock:
+        cache.entries[key] = (time.monotonic(), report)
+        cache.entries.move_to_end(key)
+        while len(cache.entries) > _RECON_REPORT_MAX_ENTRIES:
+            cache.entries.popitem(last=False)
+
+
+async def _generate_recon_report(raw_output: str) -> AsyncIterator[str]:
+    from src.utils.llm.config_manager import get_current_llm
+
+    llm = get_current_llm()
+
+    # 접두부가 호출 간 동일하므로 접두부 캐시를 지원하는 LLM 서버에서 재사용 가능
+    prompt = _RECON_PROMPT_PREFIX + raw_output
+
+    async for chunk in llm.astream(prompt):
+        yield chunk.content if isinstance(chunk.content, str) else chunk.text()
 
 
 def _render_recon_report_section():
@@ -184,7 +353,9 @@ def _render_recon_report_section():
     if report:
         st.markdown(report)
     else:
-        st.info("Recon output captured. Generating report...")
+        # 최초 1회만 스트리밍 (이후 리런은 세션 상태의 리포트 사용)
+        report = _stream_recon_report(raw_output)
+        st.session_state["recon_report"] = report
 
     if st.button("Proceed to Initial Access (Simulated)", use_container_width=False):
         st.session_state["auto_user_input"] = (
@@ -257,16 +428,20 @@ def _display_main_interface():
             structured_messages = st.session_state.get('structured_messages', [])
             chat_messages.display_messages(structured_messages, messages_area)
     
-    # Floating 터미널 토글 버튼 - 워크플로우와 독립적으로 처리
-    _handle_terminal_toggle()
-    
-    # Floating 터미널 표시
-    _render_floating_terminal()
+    # Floating 터미널 토글 버튼 + 터미널 표시 (fragment 단위 리런)
+    _render_floating_terminal_fragment()
     
     # 사용자 입력 처리
     _handle_user_input(messages_area)
 
 
+@st.fragment
+def _render_floating_terminal_fragment():
+    """터미널 토글 + 플로팅 터미널 - 토글 시 전체 페이지 대신 이 영역만 리런"""
+    _handle_terminal_toggle()
+    _render_floating_terminal()
+
+
 def _handle_terminal_toggle():
     """터미널 토글 버튼 처리 - 워크플로우와 독립적"""
     toggle_clicked = terminal_ui.create_floating_toggle_button(st.session_state.terminal_visible)
@@ -275,8 +450,8 @@ def _handle_terminal_toggle():
         # 터미널 상태 토글
         st.session_state.terminal_visible = not st.session_state.terminal_visible
         
-        # 토글 시에만 즉시 리랜더링 (워크플로우 실행 중에도 작동)
-        st.rerun()
+        # 버튼 라벨/터미널 표시 갱신을 위해 fragment만 리런
+        st.rerun(scope="fragment")
 
 
 def _render_floating_terminal():
@@ -331,14 +506,6 @@ def _handle_user_input(messages_area):
                 if result["error_message"]:
                     st.error(result["error_message"])
 
-        def _run_async_safely(coro):
-            try:
-                return asyncio.run(coro)
-            except BaseException as e:
-                if StopException is not None and isinstance(e, StopException):
-                    return None
-                raise
-
         _run_async_safely(execute_workflow())
 
         if st.session_state.get("pending_new_chat", False) and not st.session_state.get(
@@ -387,9 +554,7 @@ def _finalize_new_chat():
     # 현재 모델로 재초기화
     current_model = st.session_state.get('current_model')
     if current_model:
-        async def reinitialize():
-            await executor_manager.initialize_with_model(current_model)
-        asyncio.run(reinitialize())
+        _run_async_safely(executor_manager.initialize_with_model(current_model))
     
     # 터미널 상태도 초기화
     terminal_processor.clear_terminal_state()
@@ -429,11 +594,8 @@ def _handle_replay_mode(replay_manager):
             # 재현 실패 시 기본 메시지 표시
             st.error("재현에 실패했습니다. 세션 데이터를 찾을 수 없습니다.")
     
-    # Floating 터미널 토글 버튼 - 워크플로우와 독립적으로 처리
-    _handle_terminal_toggle()
-    
-    # Floating 터미널 표시
-    _render_floating_terminal()
+    # Floating 터미널 토글 버튼 + 터미널 표시 (fragment 단위 리런)
+    _render_floating_terminal_fragment()
     
     # 재현 완료 후 버튼
     if st.session_state.get("replay_completed", False):
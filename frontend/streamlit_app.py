@@ -4,7 +4,6 @@ Model Selection Page (리팩토링됨)
 """
 
 import streamlit as st
-import asyncio
 import time
 import os
 import sys
@@ -25,6 +24,7 @@ from frontend.web.components.theme_ui import ThemeUIComponent
 from frontend.web.core.app_state import get_app_state_manager
 from frontend.web.core.executor_manager import get_executor_manager
 from frontend.web.core.model_manager import get_model_manager
+from frontend.web.core.async_runner import get_async_runner
 
 # 유틸리티
 from frontend.web.utils.constants import ICON, ICON_TEXT, COMPANY_LINK
@@ -103,7 +103,7 @@ def _perform_model_initialization_in_container(model_info):
     """모델 초기화 수행 (container 내부에서 직접 수행)"""
     try:
         with st.spinner(f"Initializing {model_info.get('display_name', 'Model')}..."):
-            success = asyncio.run(executor_manager.initialize_with_model(model_info))
+            success = get_async_runner().run(executor_manager.initialize_with_model(model_info))
         
         if success:
             st.session_state.executor_ready = True
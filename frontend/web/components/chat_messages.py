@@ -4,6 +4,7 @@
 """
 
 import streamlit as st
+import itertools
 import re
 import time
 from datetime import datetime
@@ -98,16 +99,29 @@ class ChatMessagesComponent:
         """
         if container is None:
             container = st
-            
-        for message in structured_messages:
-            message_type = message.get("type", "")
-            
+        
+        # 같은 에이전트의 연속된 AI 메시지는 하나의 chat_message 블록으로 묶어서 표시
+        for (message_type, _), group in itertools.groupby(structured_messages, key=self._group_key):
             if message_type == "user":
-                self.display_user_message(message, container)
+                for message in group:
+                    self.display_user_message(message, container)
             elif message_type == "ai":
-                self.display_agent_message(message, container, streaming=False)
+                self._display_agent_message_group(list(group), container)
             elif message_type == "tool":
-                self.display_tool_message(message, container)
+                for message in group:
+                    self.display_tool_message(message, container)
+    
+    @staticmethod
+    def _group_key(message: Dict[str, Any]) -> tuple:
+        """메시지 묶음 키 - AI 메시지만 에이전트/표시 정보 기준으로 묶음"""
+        message_type = message.get("type", "")
+        if message_type != "ai":
+            # AI 외 메시지는 항상 개별 그룹
+            return (message_type, id(message))
+        return (
+            message_type,
+            (message.get("agent_id"), message.get("display_name"), message.get("avatar"), str(message.get("namespace", "")))
+        )
     
     def display_user_message(self, message: Dict[str, Any], container=None):
         """사용자 메시지 UI 표시
@@ -137,32 +151,7 @@ class ChatMessagesComponent:
             
         display_name = message.get("display_name", "Agent")
         avatar = message.get("avatar", "🤖")
-        
-        # 재현 시스템과 일반 시스템 모두 호환
-        if "data" in message and isinstance(message["data"], dict):
-            content = message["data"].get("content", "")
-            tool_calls = message.get("tool_calls", [])
-        else:
-            content = message.get("content", "")
-            tool_calls = message.get("tool_calls", [])
-        
-        # 에이전트 색상 및 클래스 생성
-        namespace = message.get("namespace", "")
-        if namespace:
-            if isinstance(namespace, str):
-                namespace_list = [namespace]
-            else:
-                namespace_list = namespace
-            
-            from src.utils.message import get_agent_name
-            agent_name_for_color = get_agent_name(namespace_list)
-            if agent_name_for_color == "Unknown":
-                agent_name_for_color = display_name
-        else:
-            agent_name_for_color = display_name
-        
-        agent_color = AgentManager.get_frontend_color(agent_name_for_color)
-        agent_class = AgentManager.get_css_class(agent_name_for_color)
+        content, tool_calls = self._get_content_and_tool_calls(message)
         
         # 고유한 메시지 ID 생성
         st.session_state.message_counter += 1
@@ -170,10 +159,7 @@ class ChatMessagesComponent:
         # 메시지 표시
         with container.chat_message("assistant", avatar=avatar):
             # 에이전트 헤더
-            st.markdown(
-                f'<div class="agent-header {agent_class}"><strong style="color: {agent_color}">{display_name}</strong></div>', 
-                unsafe_allow_html=True
-            )
+            self._display_agent_header(message, display_name)
             
             # 컨텐츠 표시
             if content:
@@ -193,6 +179,87 @@ class ChatMessagesComponent:
                 for i, tool_call in enumerate(tool_calls):
                     self._display_tool_call(tool_call)
     
+    def _display_agent_message_group(self, messages: List[Dict[str, Any]], container):
+        """같은 에이전트의 연속된 AI 메시지를 하나의 블록으로 표시 (스트리밍 없음)
+        
+        Args:
+            messages: 같은 에이전트의 연속된 메시지 목록
+            container: 표시할 컨테이너
+        """
+        first = messages[0]
+        display_name = first.get("display_name", "Agent")
+        avatar = first.get("avatar", "🤖")
+        
+        st.session_state.message_counter += len(messages)
+        
+        with container.chat_message("assistant", avatar=avatar):
+            self._display_agent_header(first, display_name)
+            
+            # 텍스트는 모아서 한 번에 렌더링, 문자열이 아닌 컨텐츠/tool call 앞에서만 끊어서 순서 유지
+            pending = []
+            rendered = False
+            for message in messages:
+                content, tool_calls = self._get_content_and_tool_calls(message)
+                if content and isinstance(content, str):
+                    pending.append(content)
+                elif content:
+                    rendered = self._flush_markdown(pending) or rendered
+                    st.write(content)
+                    rendered = True
+                if tool_calls:
+                    rendered = self._flush_markdown(pending) or rendered
+                    for tool_call in tool_calls:
+                        self._display_tool_call(tool_call)
+                    rendered = True
+            
+            rendered = self._flush_markdown(pending) or rendered
+            if not rendered:
+                st.write("No content available")
+    
+    def _flush_markdown(self, pending: List[str]) -> bool:
+        """모아둔 텍스트를 하나의 markdown으로 출력하고 비움
+        
+        Returns:
+            bool: 출력 여부
+        """
+        if not pending:
+            return False
+        st.markdown("\n\n".join(pending))
+        pending.clear()
+        return True
+    
+    def _get_content_and_tool_calls(self, message: Dict[str, Any]) -> tuple:
+        """메시지 컨텐츠 및 tool calls 추출 (재현 시스템과 일반 시스템 모두 호환)"""
+        if "data" in message and isinstance(message["data"], dict):
+            content = message["data"].get("content", "")
+        else:
+            content = message.get("content", "")
+        return content, message.get("tool_calls", [])
+    
+    def _display_agent_header(self, message: Dict[str, Any], display_name: str):
+        """에이전트 헤더 표시 (색상 및 CSS 클래스 포함)"""
+        namespace = message.get("namespace", "")
+        if namespace:
+            if isinstance(namespace, str):
+                namespace_list = [namespace]
+            else:
+                namespace_list = namespace
+            
+            from src.utils.message import get_agent_name
+            agent_name_for_color = get_agent_name(namespace_list)
+            if agent_name_for_color == "Unknown":
+                agent_name_for_color = display_name
+        else:
+            agent_name_for_color = display_name
+        
+        agent_color = AgentManager.get_frontend_color(agent_name_for_color)
+        agent_class = AgentManager.get_css_class(agent_name_for_color)
+        
+        st.markdown(
+            f'<div class="agent-header {agent_class}"><strong style="color: {agent_color}">{display_name}</strong></div>', 
+            unsafe_allow_html=True
+        )
+    
     def _display_tool_call(self, tool_call: Dict[str, Any]):
         """Tool call 정보 표시
         
@@ -19,9 +19,13 @@ from src.utils.agents import AgentManager
 class SidebarComponent:
     """사이드바 UI 컴포넌트"""
     
-    def __init__(self):
-        """컴포넌트 초기화"""
-        pass
+    def __init__(self, theme_ui: Optional[ThemeUIComponent] = None):
+        """컴포넌트 초기화
+        
+        Args:
+            theme_ui: 공유할 테마 컴포넌트 (생략 시 새로 생성 - 생성 시 프로젝트 루트 탐색 발생)
+        """
+        self.theme_ui = theme_ui or ThemeUIComponent()
     
     def render_agent_status(
         self, 
@@ -301,7 +305,7 @@ class SidebarComponent:
             callbacks: 콜백 함수들
         """
         with st.sidebar:
-            ThemeUIComponent().render_sidebar_logo(link_url=COMPANY_LINK)
+            self.theme_ui.render_sidebar_logo(link_url=COMPANY_LINK)
 
             # 에이전트 상태
             agents_container = st.container()
@@ -0,0 +1,175 @@
+"""
+비동기 실행 모듈
+- 세션별 영속 이벤트 루프 (백그라운드 스레드)
+- Streamlit 스크립트 스레드에서 코루틴 동기 실행
+"""
+
+import streamlit as st
+import asyncio
+import concurrent.futures
+import threading
+import weakref
+from typing import Any, AsyncIterator, Coroutine, Iterator, List
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    """루프 스레드 본체 - 루프가 정지되면 닫고 종료"""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+async def _shutdown(resources: List[Any]):
+    """남은 작업 취소, 등록된 리소스 aclose() 후 루프 정지"""
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    for resource in resources:
+        try:
+            await resource.aclose()
+        except Exception:
+            pass
+
+    asyncio.get_running_loop().stop()
+
+
+def _schedule_shutdown(loop: asyncio.AbstractEventLoop, resources: List[Any]):
+    """어느 스레드에서 호출되어도 블로킹 없이 루프 종료 예약"""
+    if loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_shutdown(resources), loop)
+    except RuntimeError:
+        # 루프가 이미 닫히는 중
+        pass
+
+
+class AsyncLoopRunner:
+    """백그라운드 스레드에서 계속 실행되는 이벤트 루프로 코루틴을 실행하는 클래스
+
+    asyncio.run 과 달리 호출마다 루프를 만들고 닫지 않으므로, 루프에 묶인
+    비동기 HTTP 클라이언트/LLM 클라이언트의 커넥션이 호출 간에 유지된다.
+    세션 상태와 함께 실행기가 수거되면(세션 만료, 새로고침) 루프와 스레드도 종료된다.
+    """
+
+    # 결과 대기 중 Stop/Rerun 요청 확인 주기 (초)
+    # 결과는 완료 즉시 반환되므로 이 값은 확인용 delta 전송 빈도와 Stop 반응 지연만 결정
+    poll_interval = 1.0
+    # 취소된 작업의 정리 대기 시간 (초)
+    cancel_timeout = 5.0
+
+    def __init__(self):
+        """이벤트 루프 및 루프 스레드 시작"""
+        self.loop = asyncio.new_event_loop()
+        self._resources: List[Any] = []
+        self.thread = threading.Thread(
+            target=_run_loop,
+            args=(self.loop,),
+            name="decepticon-async-loop",
+            daemon=True
+        )
+        self.thread.start()
+        # 콜백이 self를 참조하지 않아야 수거 가능
+        self._finalizer = weakref.finalize(self, _schedule_shutdown, self.loop, self._resources)
+
+    def register(self, resource: Any) -> Any:
+        """루프 종료 시 aclose()할 루프 바인딩 리소스 등록 (예: httpx.AsyncClient)
+
+        Returns:
+            Any: 등록한 리소스
+        """
+        self._resources.append(resource)
+        return resource
+
+    def close(self):
+        """등록된 리소스를 닫고 루프 스레드 종료 (여러 번 호출해도 안전)"""
+        self._finalizer()
+
+    def run(self, coro: Coroutine[Any, Any, Any], yield_point: Any = None) -> Any:
+        """코루틴을 루프에서 실행하고 결과를 기다림
+
+        Args:
+            coro: 실행할 코루틴
+            yield_point: Stop/Rerun 확인용 st.empty() (반복 호출 시 요소가 늘지 않도록 공유)
+
+        Returns:
+            Any: 코루틴 반환값
+        """
+        if threading.current_thread() is self.thread:
+            coro.close()
+            raise RuntimeError("AsyncLoopRunner.run() cannot be called from its own loop thread")
+
+        # 루프 스레드에서도 st.* 호출이 현재 스크립트 실행에 연결되도록 컨텍스트 전달
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            add_script_run_ctx(self.thread, ctx)
+
+        started = threading.Event()
+        finished = threading.Event()
+
+        async def _tracked():
+            started.set()
+            try:
+                return await coro
+            finally:
+                finished.set()
+
+        future = asyncio.run_coroutine_threadsafe(_tracked(), self.loop)
+        try:
+            while True:
+                done, _ = concurrent.futures.wait([future], timeout=self.poll_interval)
+                if done:
+                    return future.result()
+
+                # 스크립트 스레드의 st.* 호출이 Stop/Rerun 요청을 예외로 전달받는 지점
+                if ctx is not None:
+                    if yield_point is None:
+                        yield_point = st.empty()
+                    yield_point.empty()
+        except BaseException:
+            # Stop/Rerun 등으로 대기가 중단되면 진행 중인 작업(LLM/HTTP 호출)을 취소하고
+            # 정리(finally 블록)가 끝날 때까지 잠시 기다림
+            future.cancel()
+            # 시작 전에 취소된 작업은 finally가 실행되지 않으므로 기다리지 않음
+            if started.is_set():
+                finished.wait(timeout=self.cancel_timeout)
+            raise
+        finally:
+            # 스레드 -> 컨텍스트 -> 세션 상태 -> 실행기 참조가 남으면 세션 종료 후에도 수거되지 않음
+            # (add_script_run_ctx는 None을 받으면 현재 컨텍스트를 붙이므로 속성을 직접 해제)
+            if ctx is not None:
+                setattr(self.thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+    def iterate(self, agen: AsyncIterator[Any]) -> Iterator[Any]:
+        """비동기 제너레이터를 루프에서 한 항목씩 진행하는 동기 제너레이터로 변환
+
+        Args:
+            agen: 진행할 비동기 제너레이터 (st.write_stream 등 동기 소비자용)
+        """
+        yield_point = st.empty() if get_script_run_ctx() is not None else None
+        try:
+            while True:
+                try:
+                    yield self.run(agen.__anext__(), yield_point)
+                except StopAsyncIteration:
+                    return
+        finally:
+            self.run(agen.aclose(), yield_point)
+
+
+def get_async_runner() -> AsyncLoopRunner:
+    """세션별 비동기 실행기 반환
+
+    스크립트 실행 컨텍스트가 루프 스레드에 연결되므로 세션 간에 루프를 공유하지 않는다.
+    """
+    if "async_runner" not in st.session_state:
+        st.session_state.async_runner = AsyncLoopRunner()
+    return st.session_state.async_runner
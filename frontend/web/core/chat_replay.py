@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any
 
 from src.utils.logging.replay import get_replay_system
 from frontend.web.core.message_processor import MessageProcessor
+from frontend.web.core.message_index import MessageIndex
 
 class ReplayManager:
     """자동 재생 관리자 - 단순화된 터미널 UI 적용"""
@@ -64,6 +65,7 @@ class ReplayManager:
         with st.status("🎬 Replaying session...", expanded=True) as status:
             
             replay_messages = []
+            replay_index = MessageIndex()
             terminal_messages = []
             event_history = []
             agent_activity = {}
@@ -82,7 +84,7 @@ class ReplayManager:
                         
                         # 중복 확인
                         if not self.message_processor.is_duplicate_message(
-                            frontend_message, replay_messages
+                            frontend_message, replay_messages, replay_index
                         ):
                             replay_messages.append(frontend_message)
                             
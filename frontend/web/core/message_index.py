@@ -0,0 +1,60 @@
+"""
+메시지 중복 검사 인덱스
+구조화된 메시지 목록의 ID/내용 시그니처를 증분 색인
+"""
+
+from typing import Any, Dict, List, Optional
+import itertools
+
+
+def message_signature(message: Dict[str, Any], content: Any) -> tuple:
+    """내용 기반 중복 검사 키 (agent_id, type, content)"""
+    if not isinstance(content, (str, type(None))):
+        content = repr(content)
+    return (message.get("agent_id"), message.get("type"), content)
+
+
+class MessageIndex:
+    """메시지 목록 하나에 대한 중복 검사 인덱스
+
+    목록 소유자(세션, 재현 실행 등)별로 하나씩 생성해 사용한다.
+    프로세스 전역 객체에 두면 세션 간 인덱스가 뒤섞여 잘못된 중복 판정이 발생한다.
+    """
+
+    def __init__(self):
+        """빈 인덱스 생성"""
+        self._messages: Optional[List[Dict[str, Any]]] = None
+        self._count = 0
+        self._ids = set()
+        self._sigs = set()
+
+    def contains(self, new_message: Dict[str, Any], messages: List[Dict[str, Any]]) -> bool:
+        """메시지가 목록에 이미 있는지 검사 (ID 또는 내용 시그니처 일치)
+
+        Args:
+            new_message: 검사할 메시지
+            messages: 기존 메시지 목록
+
+        Returns:
+            bool: 중복 여부
+        """
+        self._sync(messages)
+
+        if new_message.get("id") in self._ids:
+            return True
+
+        return message_signature(new_message, new_message.get("content", "")) in self._sigs
+
+    def _sync(self, messages: List[Dict[str, Any]]):
+        """목록에 새로 추가된 항목만 인덱스에 반영"""
+        if messages is not self._messages or len(messages) < self._count:
+            # 다른 목록이거나 목록이 줄어든 경우 전체 재구성
+            self._ids = set()
+            self._sigs = set()
+            self._messages = messages
+            self._count = 0
+
+        for msg in itertools.islice(messages, self._count, None):
+            self._ids.add(msg.get("id"))
+            self._sigs.add(message_signature(msg, msg.get("content")))
+        self._count = len(messages)
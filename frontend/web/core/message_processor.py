@@ -3,9 +3,11 @@
 CLI 메시지를 프론트엔드 메시지로 변환하는 핵심 로직
 """
 
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Final, List, Optional
+import functools
+import hashlib
 import os
+import re
 import sys
 
 # 프로젝트 루트 경로 추가
@@ -15,6 +17,130 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 from src.utils.message import parse_tool_name, extract_tool_calls
 # 리팩토링된 에이전트 관리자
 from src.utils.agents import AgentManager
+from frontend.web.core.message_index import MessageIndex
+
+
+def _sig(value: Any) -> str:
+    """메시지 ID용 내용 다이제스트 (hash()와 달리 프로세스 간 동일)"""
+    text = value if isinstance(value, str) else repr(value)
+    return hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=8).hexdigest()
+
+
+# 에이전트 이름 기반 조회 캐시 (에이전트 종류가 적어 반복 호출이 대부분 캐시 적중)
+@functools.lru_cache(maxsize=64)
+def _display_name(agent_name: str) -> str:
+    return AgentManager.get_display_name(agent_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _avatar(agent_name: str) -> str:
+    return AgentManager.get_avatar(agent_name)
+
+
+# 에이전트 이름 구분자(공백, -, ., /)를 밑줄로 정규화하는 변환 테이블
+_IA_TRANS: Final = str.maketrans({" ": "_", "-": "_", ".": "_", "/": "_"})
+
+
+@functools.lru_cache(maxsize=32)
+def _is_initial_access_name(agent_name: str) -> bool:
+    return "initial_access" in (agent_name or "").strip().lower().translate(_IA_TRANS)
+
+
+@functools.lru_cache(maxsize=32)
+def _is_summary_name(agent_name: str) -> bool:
+    return "summary" in (agent_name or "").strip().lower()
+
+
+def _compile_terms(terms) -> "re.Pattern[str]":
+    """금지어 목록을 대소문자 무시 단일 정규식으로 컴파일"""
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+
+# Initial Access 출력 검증용 패턴 (모듈 로드 시 1회 컴파일)
+_IA_HEADING_RE = _compile_terms(["initial access assessment (simulated)"])
+_BANNED_IA_RE = _compile_terms([
+    "cve",
+    "exploit",
+    "backdoor",
+    "rce",
+    "shell",
+    "root",
+    "metasploit",
+    "eternalblue",
+    "brute-force",
+    "bruteforce",
+    "command",
+    "payload",
+    "port-by-port",
+])
+
+# Summary 출력 검증용 패턴
+_SUMMARY_HEADING_RE = _compile_terms(["engagement summary (public demo safe)"])
+_BANNED_SUMMARY_RE = _compile_terms([
+    "cve",
+    "exploit",
+    "backdoor",
+    "metasploit",
+    "msfconsole",
+    "payload",
+    "reverse shell",
+    "netcat",
+    "hydra",
+    "sqlmap",
+    "command",
+    "rce",
+    "remote command execution",
+    "shell",
+    "```",
+])
+
+
+# 검증 실패 시 대체 출력 (모듈 로드 시 1회 생성)
+_INITIAL_ACCESS_SAFE_TEMPLATE: Final[str] = (
+    "Initial Access Assessment (Simulated)\n\n"
+    "Selected Entry Vector:\n"
+    "Legacy file transfer service exposed to the network\n\n"
+    "Reason for Selection:\n"
+    "The reconnaissance phase identified an outdated externally accessible service. "
+    "From a risk perspective, legacy services often present higher exposure due to age, reduced maintenance, "
+    "and historically weaker security controls, making them a common initial access candidate in controlled environments.\n\n"
+    "Required Preconditions:\n"
+    "- Network connectivity to the target system\n"
+    "- Service accessible without restrictive access controls\n\n"
+    "Expected Outcome (Simulated):\n"
+    "Potential initial foothold with limited privileges, enabling further impact assessment.\n\n"
+    "Risk Level:\n"
+    "Critical\n\n"
+    "Confidence Level:\n"
+    "High\n\n"
+    "Potential Next Steps (Theoretical):\n"
+    "- Privilege escalation risk evaluation\n"
+    "- Lateral movement exposure assessment\n"
+    "- Persistence and detection impact review"
+)
+
+_SUMMARY_SAFE_TEMPLATE: Final[str] = (
+    "Engagement Summary (Public Demo Safe)\n\n"
+    "Executive Overview:\n"
+    "The assessment identified externally exposed services with indicators of outdated configurations and insufficient access controls. "
+    "These conditions increase the likelihood of unauthorized access attempts and elevate overall risk.\n\n"
+    "Key Observations:\n"
+    "- Multiple network-exposed services were identified that warrant hardening and access review\n"
+    "- Service configuration and version hygiene appear inconsistent\n"
+    "- Preventive controls (segmentation, allowlisting, and monitoring) should be strengthened\n\n"
+    "Primary Risks:\n"
+    "- Unauthorized access via exposed services (Impact: High, Likelihood: Medium)\n"
+    "- Credential exposure or weak authentication controls (Impact: High, Likelihood: Medium)\n\n"
+    "Recommended Mitigations (Non-Operational):\n"
+    "- Reduce external exposure to only required services and enforce strict access policies\n"
+    "- Standardize patching/version management and configuration baselines\n"
+    "- Strengthen authentication, logging, and monitoring for externally reachable systems\n\n"
+    "Scope & Limitations:\n"
+    "- Findings are based on observed service exposure and provided reconnaissance artifacts\n"
+    "- This summary intentionally omits operational detail to remain public-demo safe\n\n"
+    "Next Phase Recommendation:\n"
+    "Proceed with prioritized remediation validation and security control review to reduce exposure and confirm risk reduction."
+)
 
 
 class MessageProcessor:
@@ -39,8 +165,8 @@ class MessageProcessor:
         raw_message = event_data.get("raw_message")
         
         # 에이전트 표시 정보 생성
-        display_name = AgentManager.get_display_name(agent_name)
-        avatar = AgentManager.get_avatar(agent_name)
+        display_name = _display_name(agent_name)
+        avatar = _avatar(agent_name)
         
         if message_type == "ai":
             return self._create_ai_message(
@@ -77,7 +203,7 @@ class MessageProcessor:
             "display_name": display_name,
             "avatar": avatar,
             "content": content,
-            "id": f"ai_{agent_name.lower()}_{hash(content[:100])}_{datetime.now().timestamp()}"
+            "id": f"ai_{agent_name.lower()}_{_sig(content)}"
         }
         
         # Tool calls 정보 추출
@@ -88,122 +214,32 @@ class MessageProcessor:
         return message
 
     def _is_initial_access_agent(self, agent_name: str) -> bool:
-        val = (agent_name or "").strip().lower()
-        return val in {"initial_access", "initial_access_agent", "initial_access\n"} or "initial_access" in val or "initial_access" in val.replace(" ", "_") or "initial_access" in val.replace("-", "_") or "initial_access" in val.replace(".", "_") or "initial_access" in val.replace("/", "_") or "initial_access" in val
+        return _is_initial_access_name(agent_name)
 
     def _is_summary_agent(self, agent_name: str) -> bool:
-        val = (agent_name or "").strip().lower()
-        return val == "summary" or "summary" in val
+        return _is_summary_name(agent_name)
 
     def _sanitize_initial_access_output(self, content: str) -> str:
         text = content or ""
-        lowered = text.lower()
-
-        required_heading = "initial access assessment (simulated)"
-        banned_terms = [
-            "cve",
-            "exploit",
-            "backdoor",
-            "rce",
-            "shell",
-            "root",
-            "metasploit",
-            "eternalblue",
-            "brute-force",
-            "bruteforce",
-            "command",
-            "payload",
-            "port-by-port",
-        ]
-
-        if required_heading not in lowered:
-            return self._initial_access_safe_template()
 
-        for term in banned_terms:
-            if term in lowered:
-                return self._initial_access_safe_template()
+        if not _IA_HEADING_RE.search(text) or _BANNED_IA_RE.search(text):
+            return self._initial_access_safe_template()
 
         return text
 
     def _initial_access_safe_template(self) -> str:
-        return (
-            "Initial Access Assessment (Simulated)\n\n"
-            "Selected Entry Vector:\n"
-            "Legacy file transfer service exposed to the network\n\n"
-            "Reason for Selection:\n"
-            "The reconnaissance phase identified an outdated externally accessible service. "
-            "From a risk perspective, legacy services often present higher exposure due to age, reduced maintenance, "
-            "and historically weaker security controls, making them a common initial access candidate in controlled environments.\n\n"
-            "Required Preconditions:\n"
-            "- Network connectivity to the target system\n"
-            "- Service accessible without restrictive access controls\n\n"
-            "Expected Outcome (Simulated):\n"
-            "Potential initial foothold with limited privileges, enabling further impact assessment.\n\n"
-            "Risk Level:\n"
-            "Critical\n\n"
-            "Confidence Level:\n"
-            "High\n\n"
-            "Potential Next Steps (Theoretical):\n"
-            "- Privilege escalation risk evaluation\n"
-            "- Lateral movement exposure assessment\n"
-            "- Persistence and detection impact review"
-        )
+        return _INITIAL_ACCESS_SAFE_TEMPLATE
 
     def _sanitize_summary_output(self, content: str) -> str:
         text = content or ""
-        lowered = text.lower()
-
-        required_heading = "engagement summary (public demo safe)"
-        banned_terms = [
-            "cve",
-            "exploit",
-            "backdoor",
-            "metasploit",
-            "msfconsole",
-            "payload",
-            "reverse shell",
-            "netcat",
-            "hydra",
-            "sqlmap",
-            "command",
-            "rce",
-            "remote command execution",
-            "shell",
-            "```",
-        ]
-
-        if required_heading not in lowered:
-            return self._summary_safe_template()
 
-        for term in banned_terms:
-            if term in lowered:
-                return self._summary_safe_template()
+        if not _SUMMARY_HEADING_RE.search(text) or _BANNED_SUMMARY_RE.search(text):
+            return self._summary_safe_template()
 
         return text
 
     def _summary_safe_template(self) -> str:
-        return (
-            "Engagement Summary (Public Demo Safe)\n\n"
-            "Executive Overview:\n"
-            "The assessment identified externally exposed services with indicators of outdated configurations and insufficient access controls. "
-            "These conditions increase the likelihood of unauthorized access attempts and elevate overall risk.\n\n"
-            "Key Observations:\n"
-            "- Multiple network-exposed services were identified that warrant hardening and access review\n"
-            "- Service configuration and version hygiene appear inconsistent\n"
-            "- Preventive controls (segmentation, allowlisting, and monitoring) should be strengthened\n\n"
-            "Primary Risks:\n"
-            "- Unauthorized access via exposed services (Impact: High, Likelihood: Medium)\n"
-            "- Credential exposure or weak authentication controls (Impact: High, Likelihood: Medium)\n\n"
-            "Recommended Mitigations (Non-Operational):\n"
-            "- Reduce external exposure to only required services and enforce strict access policies\n"
-            "- Standardize patching/version management and configuration baselines\n"
-            "- Strengthen authentication, logging, and monitoring for externally reachable systems\n\n"
-            "Scope & Limitations:\n"
-            "- Findings are based on observed service exposure and provided reconnaissance artifacts\n"
-            "- This summary intentionally omits operational detail to remain public-demo safe\n\n"
-            "Next Phase Recommendation:\n"
-            "Proceed with prioritized remediation validation and security control review to reduce exposure and confirm risk reduction."
-        )
+        return _SUMMARY_SAFE_TEMPLATE
     
     def _create_tool_message(self, event_data: Dict[str, Any], content: str) -> Dict[str, Any]:
         """도구 메시지 생성"""
@@ -215,7 +251,7 @@ class MessageProcessor:
             "tool_name": tool_name,
             "tool_display_name": tool_display_name,
             "content": content,
-            "id": f"tool_{tool_name}_{hash(content[:100])}_{datetime.now().timestamp()}"
+            "id": f"tool_{tool_name}_{_sig(content)}"
         }
     
     def _create_user_message(self, content: str) -> Dict[str, Any]:
@@ -223,7 +259,7 @@ class MessageProcessor:
         return {
             "type": "user",
             "content": content,
-            "id": f"user_{hash(content)}_{datetime.now().timestamp()}"
+            "id": f"user_{_sig(content)}"
         }
     
     def extract_agent_status(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -243,36 +279,29 @@ class MessageProcessor:
                     break
         
         # 총 스텝 수 계산
-        status["current_step"] = len([e for e in events if e.get("type") == "message"])
+        status["current_step"] = sum(1 for e in events if e.get("type") == "message")
         
         return status
     
     def is_duplicate_message(
         self, 
         new_message: Dict[str, Any], 
-        existing_messages: List[Dict[str, Any]]
+        existing_messages: List[Dict[str, Any]],
+        index: Optional[MessageIndex] = None
     ) -> bool:
-        """메시지 중복 검사"""
-        new_id = new_message.get("id")
-        if not new_id:
-            return False
-        
-        # ID 기반 중복 검사
-        for msg in existing_messages:
-            if msg.get("id") == new_id:
-                return True
+        """메시지 중복 검사
         
-        # 내용 기반 중복 검사 (같은 에이전트의 같은 내용)
-        new_agent = new_message.get("agent_id")
-        new_content = new_message.get("content", "")
-        
-        for msg in existing_messages:
-            if (msg.get("agent_id") == new_agent and 
-                msg.get("type") == new_message.get("type") and
-                msg.get("content") == new_content):
-                return True
+        Args:
+            new_message: 검사할 메시지
+            existing_messages: 기존 메시지 목록
+            index: existing_messages 소유자의 중복 검사 인덱스 (생략 시 목록 전체 검사)
+        """
+        if not new_message.get("id"):
+            return False
         
-        return False
+        if index is None:
+            index = MessageIndex()
+        return index.contains(new_message, existing_messages)
 
 
 # 전역 메시지 프로세서 인스턴스
@@ -12,9 +12,14 @@ import streamlit as st
 class TerminalProcessor:
     """터미널 데이터 처리 핵심 로직"""
     
-    def __init__(self):
-        """터미널 프로세서 초기화"""
-        self.processed_messages = set()  # 처리된 메시지 추적
+    def _processed_messages(self) -> set:
+        """현재 세션에서 터미널 히스토리에 반영한 메시지 ID 집합
+        
+        프로세서 인스턴스는 세션 간 공유되므로 처리 기록은 세션 상태에 둔다.
+        """
+        if "terminal_processed_messages" not in st.session_state:
+            st.session_state.terminal_processed_messages = set()
+        return st.session_state.terminal_processed_messages
     
     def clean_command(self, command: str) -> str:
         """명령어 정리 로직
@@ -113,11 +118,13 @@ class TerminalProcessor:
         if not frontend_messages:
             return terminal_entries
         
+        processed_messages = self._processed_messages()
+        
         for message in frontend_messages:
             message_id = message.get("id")
             
             # 이미 처리한 메시지는 건너뛰기
-            if message_id in self.processed_messages:
+            if message_id in processed_messages:
                 continue
                 
             message_type = message.get("type")
@@ -148,7 +155,7 @@ class TerminalProcessor:
                         })
                 
                 # 처리된 메시지로 표시
-                self.processed_messages.add(message_id)
+                processed_messages.add(message_id)
         
         return terminal_entries
     
@@ -239,12 +246,14 @@ class TerminalProcessor:
         if not structured_messages:
             return terminal_entries
         
+        processed_messages = self._processed_messages()
+        
         # 메시지 순회 및 처리
         for message in structured_messages:
             message_id = message.get("id")
             
             # 이미 처리한 메시지는 건너뜀
-            if message_id in self.processed_messages:
+            if message_id in processed_messages:
                 continue
                 
             message_type = message.get("type")
@@ -268,7 +277,7 @@ class TerminalProcessor:
                         "timestamp": datetime.now().strftime("%H:%M:%S")
                     })
                     
-                    self.processed_messages.add(message_id)
+                    processed_messages.add(message_id)
         
         return terminal_entries
     
@@ -276,10 +285,14 @@ class TerminalProcessor:
         """터미널 상태 초기화"""
         if "terminal_history" not in st.session_state:
             st.session_state.terminal_history = []
+        
+        # 히스토리가 비었으면(세션 리셋 등) 처리 기록도 초기화해 같은 메시지를 다시 반영
+        if not st.session_state.terminal_history:
+            st.session_state.terminal_processed_messages = set()
     
     def clear_terminal_state(self):
         """터미널 상태 완전 초기화"""
-        self.processed_messages = set()
+        st.session_state.terminal_processed_messages = set()
         st.session_state.terminal_history = []
     
     def get_terminal_history(self) -> List[Dict[str, Any]]:
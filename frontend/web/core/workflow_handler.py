@@ -21,6 +21,7 @@ except Exception:
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 
 from frontend.web.core.message_processor import MessageProcessor
+from frontend.web.core.message_index import MessageIndex
 from frontend.web.core.executor_manager import get_executor_manager
 
 
@@ -65,6 +66,12 @@ class WorkflowHandler:
         st.session_state.structured_messages.append(user_message)
         return user_message
     
+    def _message_index(self) -> MessageIndex:
+        """세션별 structured_messages 중복 검사 인덱스 반환 (핸들러는 세션 간 공유됨)"""
+        if "message_index" not in st.session_state:
+            st.session_state.message_index = MessageIndex()
+        return st.session_state.message_index
+    
     async def execute_workflow_logic(
         self, 
         user_input: str,
@@ -139,7 +146,7 @@ class WorkflowHandler:
                         break
                     
                     # 에이전트 상태 업데이트 (순수 로직)
-                    self._update_agent_status_logic()
+                    self._update_agent_status_logic(event)
                     
                 except Exception as e:
                     execution_result["error_message"] = f"Event processing error: {str(e)}"
@@ -222,7 +229,7 @@ class WorkflowHandler:
         
         # 중복 메시지 체크
         if self.message_processor.is_duplicate_message(
-            frontend_message, st.session_state.structured_messages
+            frontend_message, st.session_state.structured_messages, self._message_index()
         ):
             return True
         
@@ -321,16 +328,18 @@ class WorkflowHandler:
                     output=content
                 )
     
-    def _update_agent_status_logic(self):
-        """에이전트 상태 업데이트 순수 로직"""
-        # 최근 이벤트에서 활성 에이전트 찾기
+    def _update_agent_status_logic(self, event: Dict[str, Any]):
+        """에이전트 상태 업데이트 순수 로직
+        
+        Args:
+            event: 방금 처리한 이벤트 (세션의 event_history 마지막 항목)
+        """
+        # 이벤트마다 호출되므로 event_history 전체를 재스캔하지 않고 현재 이벤트만 확인
         active_agent = None
-        for event in reversed(st.session_state.event_history):
-            if event.get("type") == "message" and event.get("message_type") == "ai":
-                agent_name = event.get("agent_name")
-                if agent_name and agent_name != "Unknown":
-                    active_agent = agent_name.lower()
-                    break
+        if event.get("type") == "message" and event.get("message_type") == "ai":
+            agent_name = event.get("agent_name")
+            if agent_name and agent_name != "Unknown":
+                active_agent = agent_name.lower()
         
         # 활성 에이전트 업데이트
         if active_agent and active_agent != st.session_state.active_agent:
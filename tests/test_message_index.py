@@ -0,0 +1,40 @@
+from frontend.web.core.message_index import MessageIndex
+
+
+def _ai(agent, content, msg_id):
+    return {"type": "ai", "agent_id": agent, "content": content, "id": msg_id}
+
+
+def test_interleaved_lists_do_not_share_index():
+    index_a, index_b = MessageIndex(), MessageIndex()
+    list_a, list_b = [], []
+
+    for i in range(3):
+        msg_a = _ai("recon", f"a{i}", f"a_{i}")
+        msg_b = _ai("recon", f"b{i}", f"b_{i}")
+
+        assert not index_a.contains(msg_a, list_a)
+        list_a.append(msg_a)
+        assert not index_b.contains(msg_b, list_b)
+        list_b.append(msg_b)
+
+    # 다른 목록의 메시지는 중복이 아님
+    assert not index_a.contains(list_b[0], list_a)
+    assert not index_b.contains(list_a[0], list_b)
+
+    # 같은 목록의 메시지는 ID/내용 모두 중복으로 판정
+    assert index_a.contains(list_a[1], list_a)
+    assert index_b.contains(_ai("recon", "b2", "other_id"), list_b)
+
+
+def test_index_rebuilds_when_list_is_replaced_or_shrinks():
+    index = MessageIndex()
+    messages = [_ai("recon", "x", "x_1")]
+    assert index.contains(messages[0], messages)
+
+    messages.clear()
+    assert not index.contains(_ai("recon", "x", "x_1"), messages)
+
+    replaced = [_ai("summary", "y", "y_1")]
+    assert index.contains(replaced[0], replaced)
+    assert not index.contains(_ai("recon", "x", "x_1"), replaced)